@@ -1,251 +1,229 @@
+import functools
 import re
 import math
 import secrets
+import string
 from collections import defaultdict
 
-class Password_Complexity_Checker:
-    def __init__(self, password, username="", email="", old_password=""):
-        self.password = password
-        self.username = username
-        self.email = email
-        self.old_password = old_password
-        self.common_passwords = self._load_common_passwords()
-        self.criteria = self._initialize_criteria()
-        
-    def _load_common_passwords(self):
-        """Load common passwords from file or use default list"""
-        try:
-            with open('common_passwords.txt') as f:
-                return [line.strip().lower() for line in f]
-        except FileNotFoundError:
-            return ["password", "123456", "qwerty", "letmein", "welcome",
-                    "admin", "12345678", "123456789", "123123", "111111"]
-    
-    def _initialize_criteria(self):
-        """Initialize all password checking criteria"""
-        return {
-            "length": len(self.password) >= 12,
-            "uppercase": bool(re.search(r"[A-Z]", self.password)),
-            "lowercase": bool(re.search(r"[a-z]", self.password)),
-            "number": bool(re.search(r"\d", self.password)),
-            "special_char": bool(re.search(r"[!@#$%^&*(),.?\":{}|<>]", self.password)),
-            "not_common": self.password.lower() not in self.common_passwords,
-            "no_sequential": not self._has_sequential_chars(),
-            "no_repeated": not self._has_repeated_chars(),
-            "no_personal_info": not self._contains_personal_info(),
-            "not_similar_old": not self._is_similar_to_old(),
-            "no_dict_words": not self._contains_dictionary_word(),
-            "no_keyboard_patterns": not self._has_keyboard_pattern()
-        }
-    
-    def _has_sequential_chars(self):
-        """Check for sequential characters (abc, 123, etc.)"""
-        sequences = [
-            "abcdefghijklmnopqrstuvwxyz",
-            "zyxwvutsrqponmlkjihgfedcba",
-            "01234567890",
-            "9876543210",
-            "qwertyuiop",
-            "poiuytrewq",
-            "asdfghjkl",
-            "lkjhgfdsa",
-            "zxcvbnm",
-            "mnbvcxz"
-        ]
-        password_lower = self.password.lower()
-        return any(seq in password_lower for seq in sequences)
-    
-    def _has_repeated_chars(self):
-        """Check for repeated characters (aaa, 111)"""
-        return re.search(r"(.)\1\1", self.password)
-    
-    def _contains_personal_info(self):
-        """Check for personal information in password"""
-        if not self.username and not self.email:
-            return False
-        personal_info = []
-        if self.username:
-            personal_info.append(self.username.lower())
-        if self.email:
-            personal_info.append(self.email.split("@")[0].lower())
-        return any(info in self.password.lower() for info in personal_info)
-    
-    def _is_similar_to_old(self):
-        """Check similarity with old password"""
-        if not self.old_password:
-            return False
-        return self.password.lower() == self.old_password.lower() or \
-               self.old_password.lower() in self.password.lower()
-    
-    def _contains_dictionary_word(self):
-        """Check for dictionary words"""
-        try:
-            with open('/usr/share/dict/words') as f:
-                dictionary = set(word.strip().lower() for word in f)
-        except FileNotFoundError:
-            return False
-        return any(word in self.password.lower() for word in dictionary if len(word) > 3)
-    
-    def _has_keyboard_pattern(self):
-        """Check for keyboard patterns"""
-        keyboard_rows = [
-            "qwertyuiop",
-            "asdfghjkl",
-            "zxcvbnm",
-            "1234567890"
-        ]
-        password_lower = self.password.lower()
-        for row in keyboard_rows:
-            for i in range(len(row) - 3):
-                if row[i:i+4] in password_lower or row[i:i+4][::-1] in password_lower:
-                    return True
-        return False
-    
-    def calculate_entropy(self):
-        """Calculate password entropy in bits"""
-        pool_size = 0
-        if re.search(r'[a-z]', self.password): pool_size += 26
-        if re.search(r'[A-Z]', self.password): pool_size += 26
-        if re.search(r'\d', self.password): pool_size += 10
-        if re.search(r'[^a-zA-Z0-9]', self.password): pool_size += 32
-        
-        return math.log2(pool_size ** len(self.password)) if pool_size else 0
-    
-    def analyze(self):
-        """Perform complete password analysis"""
-        score = sum(self.criteria.values())
-        total_criteria = len(self.criteria)
-        entropy = self.calculate_entropy()
-        
-        strength = self._get_strength_label(score, entropy)
-        
-        return {
-            "score": score,
-            "total_possible": total_criteria,
-            "strength": strength,
-            "entropy": entropy,
-            "is_strong": score >= total_criteria * 0.75,
-            "failed_checks": [k for k, v in self.criteria.items() if not v]
-        }
-    
-    @staticmethod
-    def _get_strength_label(score, entropy):
-        """Determine strength label based on score and entropy"""
-        if score >= 10 and entropy >= 75:
-            return "excellent"
-        elif score >= 8 and entropy >= 60:
-            return "very_strong"
-        elif score >= 6 and entropy >= 45:
-            return "strong"
-        elif score >= 4 and entropy >= 30:
-            return "moderate"
-        elif score >= 2:
-            return "weak"
-        else:
-            return "very_weak"
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
-def get_password_input():
-    """Get password input from user"""
-    print("Enter password to analyze: ")
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Pre-compiled patterns, shared by all checker instances.
+_RE_SPECIAL = re.compile(r'[!@#$%^&*(),.?":{}|<>]')
+_RE_REPEAT = re.compile(r"(.)\1\1")
+
+# Character-class flags: lowercase, uppercase, digit, anything else.
+_LOWER, _UPPER, _DIGIT, _OTHER = 1, 2, 4, 8
+
+_LOWER_SET = frozenset(string.ascii_lowercase)
+_UPPER_SET = frozenset(string.ascii_uppercase)
+_DIGIT_SET = frozenset(string.digits)
+_ALNUM_SET = _LOWER_SET | _UPPER_SET | _DIGIT_SET
+
+def _char_class_mask(password):
+    """Return the OR of the class flags present in the password"""
+    chars = set(password)
+    mask = 0
+    if not chars.isdisjoint(_LOWER_SET): mask |= _LOWER
+    if not chars.isdisjoint(_UPPER_SET): mask |= _UPPER
+    if not chars.isdisjoint(_DIGIT_SET): mask |= _DIGIT
+    if chars - _ALNUM_SET: mask |= _OTHER
+    return mask
+
+# Static needle sets shared by the substring-based criteria.
+_SEQUENCES = (
+    "abcdefghijklmnopqrstuvwxyz",
+    "zyxwvutsrqponmlkjihgfedcba",
+    "01234567890",
+    "9876543210",
+    "qwertyuiop",
+    "poiuytrewq",
+    "asdfghjkl",
+    "lkjhgfdsa",
+    "zxcvbnm",
+    "mnbvcxz"
+)
+_KEYBOARD_ROWS = (
+    "qwertyuiop",
+    "asdfghjkl",
+    "zxcvbnm",
+    "1234567890"
+)
+# Every length-4 keyboard-row slice, forward and reversed.
+_KB_4GRAMS = frozenset(
+    gram
+    for row in _KEYBOARD_ROWS
+    for i in range(len(row) - 3)
+    for gram in (row[i:i+4], row[i:i+4][::-1])
+)
+# Alternations over the fixed needle lists keep the fallback scans in C.
+_SEQ_RE = re.compile("|".join(re.escape(seq) for seq in _SEQUENCES))
+_KBD_RE = re.compile("|".join(re.escape(gram) for gram in sorted(_KB_4GRAMS)))
+
+@functools.lru_cache(maxsize=1)
+def _common_passwords():
+    """Load common passwords once per process as a frozenset"""
     try:
-        import getpass
-        return getpass.getpass()
-    except Exception:
-        return input()
+        with open('common_passwords.txt') as f:
+            return frozenset(line.strip().lower() for line in f)
+    except FileNotFoundError:
+        return frozenset(["password", "123456", "qwerty", "letmein", "welcome",
+                          "admin", "12345678", "123456789", "123123", "111111"])
 
-def create_secure_password():
-    """Generate a secure password suggestion"""
-    adjectives = ["Red", "Blue", "Happy", "Secure", "Strong"]
-    nouns = ["Dragon", "Coffee", "Mountain", "Shield", "Castle"]
-    special = secrets.choice("!@#$%^&*")
-    number = f"{secrets.randbelow(90) + 10:02d}"
-    return f"{secrets.choice(adjectives)}{secrets.choice(nouns)}{number}{special}"
+@functools.lru_cache(maxsize=1)
+def _load_dict_words():
+    """Load the system word list once per process, pre-filtered to words
+    longer than 3 characters"""
+    try:
+        with open('/usr/share/dict/words') as f:
+            return frozenset(word for word in (line.strip().lower() for line in f)
+                             if len(word) > 3)
+    except FileNotFoundError:
+        return frozenset()
 
-def main():
-    """Main execution function"""
-    password = get_password_input()
-    if not password:
-        print("Error: Password cannot be empty")
-        return
-    
-    analyzer = Password_Complexity_Checker(password)
-    result = analyzer.analyze()
-    
-    print("\nPassword Analysis Results:")
-    print(f"Strength: {result['strength'].replace('_', ' ').title()}")
-    print(f"Score: {result['score']}/{result['total_possible']}")
-    print(f"Entropy: {result['entropy']:.1f} bits")
-    
-    if result['failed_checks']:
-        print("\nFailed Checks:")
-        for check in result['failed_checks']:
-            print(f"- {check.replace('_', ' ').title()}")
-    
-    if not result['is_strong']:
-        print(f"\nSuggested secure password: {create_secure_password()}")
+@functools.lru_cache(maxsize=1)
+def _static_needles():
+    """Map every static needle to the frozenset of criteria it belongs to"""
+    needles = defaultdict(set)
+    for seq in _SEQUENCES:
+        needles[seq].add("seq")
+    for gram in _KB_4GRAMS:
+        needles[gram].add("kbd")
+    for word in _load_dict_words():
+        needles[word].add("dict")
+    return {pattern: frozenset(tags) for pattern, tags in needles.items()}
 
-if __name__ == "__main__":
-    main()import re
-import math
-import secrets
-from collections import defaultdict
+@functools.lru_cache(maxsize=1)
+def _static_automaton():
+    """Build one Aho-Corasick automaton over all static needle sets, with
+    each pattern tagged by the criteria it belongs to, or None if the
+    pyahocorasick extension is unavailable"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for pattern, tags in _static_needles().items():
+        automaton.add_word(pattern, tags)
+    automaton.make_automaton()
+    return automaton
+
+@functools.lru_cache(maxsize=1)
+def _hyperscan_db():
+    """Compile all static needles into a Hyperscan database, returning
+    (db, scratch, tag table indexed by pattern id), or None if the
+    hyperscan extension is unavailable"""
+    if hyperscan is None:
+        return None
+    needles = _static_needles()
+    patterns = list(needles)
+    db = hyperscan.Database()
+    db.compile(expressions=[re.escape(p).encode() for p in patterns],
+               ids=list(range(len(patterns))),
+               flags=[hyperscan.HS_FLAG_CASELESS] * len(patterns))
+    return db, hyperscan.Scratch(db), [needles[p] for p in patterns]
+
+def reload_wordlists():
+    """Drop the cached word lists and the matcher state built from them so
+    the next check re-reads the source files"""
+    _common_passwords.cache_clear()
+    _load_dict_words.cache_clear()
+    _static_needles.cache_clear()
+    _static_automaton.cache_clear()
+    _hyperscan_db.cache_clear()
 
 class Password_Complexity_Checker:
+    __slots__ = ("password", "username", "email", "old_password",
+                 "_pw_lower", "_old_pw_lower", "common_passwords", "_criteria")
+
     def __init__(self, password, username="", email="", old_password=""):
         self.password = password
         self.username = username
         self.email = email
         self.old_password = old_password
+        self._pw_lower = password.lower()
+        self._old_pw_lower = old_password.lower()
         self.common_passwords = self._load_common_passwords()
-        self.criteria = self._initialize_criteria()
-        
+        self._criteria = None
+
     def _load_common_passwords(self):
         """Load common passwords from file or use default list"""
-        try:
-            with open('common_passwords.txt') as f:
-                return [line.strip().lower() for line in f]
-        except FileNotFoundError:
-            return ["password", "123456", "qwerty", "letmein", "welcome",
-                    "admin", "12345678", "123456789", "123123", "111111"]
-    
+        return _common_passwords()
+
+    @property
+    def criteria(self):
+        """Password checking criteria, evaluated on first access"""
+        if self._criteria is None:
+            self._criteria = self._initialize_criteria()
+        return self._criteria
+
     def _initialize_criteria(self):
-        """Initialize all password checking criteria"""
-        return {
+        """Evaluate all password checking criteria, cheapest first"""
+        password_lower = self._pw_lower
+        class_mask = _char_class_mask(self.password)
+        criteria = {
             "length": len(self.password) >= 12,
-            "uppercase": bool(re.search(r"[A-Z]", self.password)),
-            "lowercase": bool(re.search(r"[a-z]", self.password)),
-            "number": bool(re.search(r"\d", self.password)),
-            "special_char": bool(re.search(r"[!@#$%^&*(),.?\":{}|<>]", self.password)),
-            "not_common": self.password.lower() not in self.common_passwords,
-            "no_sequential": not self._has_sequential_chars(),
+            "uppercase": bool(class_mask & _UPPER),
+            "lowercase": bool(class_mask & _LOWER),
+            "number": bool(class_mask & _DIGIT),
+            "special_char": bool(_RE_SPECIAL.search(self.password)),
+            "not_common": password_lower not in self.common_passwords,
             "no_repeated": not self._has_repeated_chars(),
             "no_personal_info": not self._contains_personal_info(),
-            "not_similar_old": not self._is_similar_to_old(),
-            "no_dict_words": not self._contains_dictionary_word(),
-            "no_keyboard_patterns": not self._has_keyboard_pattern()
+            "not_similar_old": not self._is_similar_to_old()
         }
-    
+        hits = self._scan_static_needles(password_lower)
+        if hits is not None:
+            criteria["no_sequential"] = "seq" not in hits
+            criteria["no_dict_words"] = "dict" not in hits
+            criteria["no_keyboard_patterns"] = "kbd" not in hits
+        else:
+            criteria["no_sequential"] = not self._has_sequential_chars()
+            criteria["no_dict_words"] = not self._contains_dictionary_word()
+            criteria["no_keyboard_patterns"] = not self._has_keyboard_pattern()
+        return criteria
+
+    @staticmethod
+    def _scan_static_needles(password_lower):
+        """Scan the password against the static needle sets in one pass,
+        returning the set of criteria tags that matched, or None when no
+        accelerated matcher is available"""
+        if len(password_lower) < 3:
+            return set()
+        hs = _hyperscan_db()
+        if hs is not None:
+            db, scratch, tag_table = hs
+            hits = set()
+            def on_match(pattern_id, start, end, flags, context):
+                hits.update(tag_table[pattern_id])
+            db.scan(password_lower.encode(), match_event_handler=on_match,
+                    scratch=scratch)
+            return hits
+        automaton = _static_automaton()
+        if automaton is not None:
+            hits = set()
+            for _, tags in automaton.iter(password_lower):
+                hits.update(tags)
+            return hits
+        return None
+
     def _has_sequential_chars(self):
         """Check for sequential characters (abc, 123, etc.)"""
-        sequences = [
-            "abcdefghijklmnopqrstuvwxyz",
-            "zyxwvutsrqponmlkjihgfedcba",
-            "01234567890",
-            "9876543210",
-            "qwertyuiop",
-            "poiuytrewq",
-            "asdfghjkl",
-            "lkjhgfdsa",
-            "zxcvbnm",
-            "mnbvcxz"
-        ]
-        password_lower = self.password.lower()
-        return any(seq in password_lower for seq in sequences)
-    
+        if len(self.password) < 3:
+            return False
+        return bool(_SEQ_RE.search(self._pw_lower))
+
     def _has_repeated_chars(self):
         """Check for repeated characters (aaa, 111)"""
-        return re.search(r"(.)\1\1", self.password)
-    
+        if len(self.password) < 3:
+            return False
+        return _RE_REPEAT.search(self.password)
+
     def _contains_personal_info(self):
         """Check for personal information in password"""
         if not self.username and not self.email:
@@ -255,57 +233,52 @@ class Password_Complexity_Checker:
             personal_info.append(self.username.lower())
         if self.email:
             personal_info.append(self.email.split("@")[0].lower())
-        return any(info in self.password.lower() for info in personal_info)
-    
+        return any(info in self._pw_lower for info in personal_info)
+
     def _is_similar_to_old(self):
         """Check similarity with old password"""
         if not self.old_password:
             return False
-        return self.password.lower() == self.old_password.lower() or \
-               self.old_password.lower() in self.password.lower()
-    
+        return self._old_pw_lower in self._pw_lower
+
     def _contains_dictionary_word(self):
         """Check for dictionary words"""
-        try:
-            with open('/usr/share/dict/words') as f:
-                dictionary = set(word.strip().lower() for word in f)
-        except FileNotFoundError:
+        if len(self.password) < 4:
             return False
-        return any(word in self.password.lower() for word in dictionary if len(word) > 3)
-    
+        dictionary = _load_dict_words()
+        if not dictionary:
+            return False
+        password_lower = self._pw_lower
+        n = len(password_lower)
+        return any(password_lower[i:j] in dictionary
+                   for i in range(n - 3)
+                   for j in range(i + 4, n + 1))
+
     def _has_keyboard_pattern(self):
         """Check for keyboard patterns"""
-        keyboard_rows = [
-            "qwertyuiop",
-            "asdfghjkl",
-            "zxcvbnm",
-            "1234567890"
-        ]
-        password_lower = self.password.lower()
-        for row in keyboard_rows:
-            for i in range(len(row) - 3):
-                if row[i:i+4] in password_lower or row[i:i+4][::-1] in password_lower:
-                    return True
-        return False
-    
+        if len(self.password) < 4:
+            return False
+        return bool(_KBD_RE.search(self._pw_lower))
+
     def calculate_entropy(self):
         """Calculate password entropy in bits"""
+        class_mask = _char_class_mask(self.password)
         pool_size = 0
-        if re.search(r'[a-z]', self.password): pool_size += 26
-        if re.search(r'[A-Z]', self.password): pool_size += 26
-        if re.search(r'\d', self.password): pool_size += 10
-        if re.search(r'[^a-zA-Z0-9]', self.password): pool_size += 32
-        
-        return math.log2(pool_size ** len(self.password)) if pool_size else 0
-    
+        if class_mask & _LOWER: pool_size += 26
+        if class_mask & _UPPER: pool_size += 26
+        if class_mask & _DIGIT: pool_size += 10
+        if class_mask & _OTHER: pool_size += 32
+
+        return len(self.password) * math.log2(pool_size) if pool_size else 0
+
     def analyze(self):
         """Perform complete password analysis"""
         score = sum(self.criteria.values())
         total_criteria = len(self.criteria)
         entropy = self.calculate_entropy()
-        
+
         strength = self._get_strength_label(score, entropy)
-        
+
         return {
             "score": score,
             "total_possible": total_criteria,
@@ -314,7 +287,7 @@ class Password_Complexity_Checker:
             "is_strong": score >= total_criteria * 0.75,
             "failed_checks": [k for k, v in self.criteria.items() if not v]
         }
-    
+
     @staticmethod
     def _get_strength_label(score, entropy):
         """Determine strength label based on score and entropy"""
@@ -331,6 +304,16 @@ class Password_Complexity_Checker:
         else:
             return "very_weak"
 
+def analyze_batch(passwords):
+    """Analyze a batch of passwords, warming the shared caches up front so
+    no password in the list pays the first-call load cost"""
+    _common_passwords()
+    _static_needles()
+    _static_automaton()
+    _hyperscan_db()
+    return [Password_Complexity_Checker(password).analyze()
+            for password in passwords]
+
 def get_password_input():
     """Get password input from user"""
     print("Enter password to analyze: ")
@@ -354,20 +337,20 @@ def main():
     if not password:
         print("Error: Password cannot be empty")
         return
-    
+
     analyzer = Password_Complexity_Checker(password)
     result = analyzer.analyze()
-    
+
     print("\nPassword Analysis Results:")
     print(f"Strength: {result['strength'].replace('_', ' ').title()}")
     print(f"Score: {result['score']}/{result['total_possible']}")
     print(f"Entropy: {result['entropy']:.1f} bits")
-    
+
     if result['failed_checks']:
         print("\nFailed Checks:")
         for check in result['failed_checks']:
             print(f"- {check.replace('_', ' ').title()}")
-    
+
     if not result['is_strong']:
         print(f"\nSuggested secure password: {create_secure_password()}")
 